@@ -1,36 +1,62 @@
 import os
 import logging
-from datetime import datetime, timedelta
-import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
-
-# Initialize Faker and logging
-fake = Faker('en_IN')
-logging.basicConfig(level=logging.INFO)
+from numba import njit
 
 # Configuration
 NUM_PRODUCTS = 100
+RANDOM_SEED = None  # set to an int for reproducible output
 DAILY_TRANSACTIONS_RANGE = (80, 120)
 STAFF_COUNT = 5
 OPERATING_HOURS = (8, 21)  # 8 AM to 9 PM
+DISCOUNTS = np.array([0, 0, 0, 0.05, 0.1])
+PAYMENT_MODES = ['Cash', 'UPI', 'Credit']
+TRANSACTION_TYPES = ['Walk-in', 'Phone Order', 'Delivery']
+TRANSACTION_TYPE_WEIGHTS = [0.7, 0.2, 0.1]
+# Compact dtypes applied when writing; generators keep float64 for pricing
+OUTPUT_DTYPES = {
+    'S.No': np.int32,
+    'quantity': np.int8,
+    'shelf_life_days': np.int16,
+    'mrp': np.float32,
+    'cost_price': np.float32,
+    'unit_price': np.float32,
+    'total_amount': np.float32,
+    'amount': np.float32,
+}
+HOLIDAYS = np.array([
+    '2024-01-26',  # Republic Day
+    '2024-03-25',  # Holi
+    '2024-08-15',  # Independence Day
+    '2024-10-02',  # Gandhi Jayanti
+    '2024-10-12',  # Dussehra
+    '2024-11-01',  # Diwali
+], dtype='datetime64[D]')
+
+# Initialize the random generator and logging
+RNG = np.random.default_rng(RANDOM_SEED)
+logging.basicConfig(level=logging.INFO)
+
+def build_brand_pool(size=200, seed=0):
+    """Build a fixed pool of brand names from a Faker seeded independently of RNG"""
+    brand_faker = Faker('en_IN')
+    brand_faker.seed_instance(seed)
+    return np.array(sorted({brand_faker.company().split()[0] for _ in range(size)}))
+
+# Same pool on every run; RNG alone decides which brands are used
+BRANDS = build_brand_pool()
 
 def generate_dates(start_date, end_date):
-    """Generate business days considering Indian holidays"""
-    holidays = [
-        datetime(2024, 1, 26),  # Republic Day
-        datetime(2024, 3, 25),  # Holi
-        datetime(2024, 8, 15),  # Independence Day
-        datetime(2024, 10, 2),  # Gandhi Jayanti
-        datetime(2024, 10, 12), # Dussehra
-        datetime(2024, 11, 1),  # Diwali
-    ]
-    
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() < 6 and current_date not in holidays:
-            yield current_date
-        current_date += timedelta(days=1)
+    """Generate business days (Monday to Saturday) considering Indian holidays"""
+    days = pd.date_range(start_date, end_date, freq='D')
+    is_holiday = np.isin(days.to_numpy().astype('datetime64[D]'), HOLIDAYS)
+    return days[(days.weekday < 6) & ~is_holiday]
 
 def generate_products(num_products):
     """Generate kirana store product inventory"""
@@ -42,65 +68,85 @@ def generate_products(num_products):
         'Groceries': ['Oil', 'Spices', 'Pulses', 'Masala']
     }
     
-    products = []
-    for i in range(num_products):
-        category = random.choice(list(categories.keys()))
-        base_name = random.choice(categories[category])
-        brand = fake.company().split()[0]
-        product_name = f"{brand} {base_name}"
-        products.append({
-            'S.No': i + 1,
-            'product_name': product_name,
-            'category': category,
-            'mrp': round(random.uniform(10, 500), 2),
-            'cost_price': round(random.uniform(5, 400), 2),
-            'shelf_life_days': random.randint(30, 720)
-        })
-    return pd.DataFrame(products)
+    mrp = RNG.uniform(10, 500, size=num_products).round(2)
+    cost_price = RNG.uniform(5, 400, size=num_products).round(2)
+    shelf_life_days = RNG.integers(30, 721, size=num_products)
+    
+    # Flatten to (category, item) pairs weighted so categories stay equally likely
+    flat = [(category, item) for category, items in categories.items() for item in items]
+    weights = np.array([1 / (len(categories) * len(categories[category])) for category, _ in flat])
+    picks = RNG.choice(len(flat), size=num_products, p=weights)
+    product_categories, base_names = zip(*(flat[i] for i in picks))
+    brands = BRANDS[RNG.integers(0, len(BRANDS), size=num_products)]
+    product_names = [f"{brand} {base_name}" for brand, base_name in zip(brands, base_names)]
+    
+    return pd.DataFrame({
+        'S.No': np.arange(1, num_products + 1),
+        'product_name': product_names,
+        'category': pd.Categorical(product_categories, categories=list(categories)),
+        'mrp': mrp,
+        'cost_price': cost_price,
+        'shelf_life_days': shelf_life_days
+    }, copy=False)
 
-def generate_transactions(start_date, end_date, products):
+@njit(cache=True)
+def _txn_kernel(draws, mrp_arr, discounts):
+    """Map uniform draws to product index, quantity and discounted amounts"""
+    n = draws.shape[1]
+    idx = np.empty(n, dtype=np.int64)
+    qty = np.empty(n, dtype=np.int64)
+    unit_price = np.empty(n)
+    total = np.empty(n)
+    for i in range(n):
+        idx[i] = int(draws[0, i] * len(mrp_arr))
+        qty[i] = 1 + int(draws[1, i] * 5)
+        disc = discounts[int(draws[2, i] * len(discounts))]
+        mrp = mrp_arr[idx[i]]
+        unit_price[i] = round(mrp * (1 - disc), 2)
+        total[i] = round(mrp * qty[i] * (1 - disc), 2)
+    return idx, qty, unit_price, total
+
+def generate_transactions(date_str, weekdays, products):
     """Generate daily sales transactions with realistic patterns"""
-    transactions = []
-    sno = 1
+    # Per-day transaction counts, with a 30% uplift on weekends
+    is_weekend = weekdays >= 5
+    low, high = DAILY_TRANSACTIONS_RANGE
+    base_transactions = RNG.integers(low, high + 1, size=len(date_str))
+    per_day_counts = (base_transactions * np.where(is_weekend, 1.3, 1.0)).astype(int)
     
-    for date in generate_dates(start_date, end_date):
-        is_weekend = date.weekday() >= 5
-        base_transactions = random.randint(*DAILY_TRANSACTIONS_RANGE)
-        multiplier = 1.3 if is_weekend else 1.0
-        daily_transactions = int(base_transactions * multiplier)
-        
-        for _ in range(daily_transactions):
-            product = random.choice(products['product_name'].tolist())
-            product_data = products[products['product_name'] == product].iloc[0]
-            qty = random.randint(1, 5)
-            mrp = product_data['mrp']
-            discount = random.choice([0, 0, 0, 0.05, 0.1])
-            
-            transactions.append({
-                'S.No': sno,
-                'date': date.strftime('%d-%m-%Y'),
-                'time': fake.time_object(end_datetime=None).strftime('%H:%M'),
-                'product_name': product,
-                'quantity': qty,
-                'unit_price': round(mrp * (1 - discount), 2),
-                'total_amount': round(mrp * qty * (1 - discount), 2),
-                'payment_mode': random.choice(['Cash', 'UPI', 'Credit']),
-                'transaction_type': random.choices(
-                    ['Walk-in', 'Phone Order', 'Delivery'],
-                    weights=[0.7, 0.2, 0.1]
-                )[0]
-            })
-            sno += 1
-        
-        logging.info(f"Generated {daily_transactions} transactions for {date.strftime('%d-%m-%Y')}")
+    # Sample every transaction of the period in one pass
+    n = int(per_day_counts.sum())
+    day_index = np.repeat(np.arange(len(date_str)), per_day_counts)
+    name_arr = products['product_name'].to_numpy()
+    mrp_arr = products['mrp'].to_numpy(dtype=np.float64)
+    pos, qty, unit_price, total = _txn_kernel(RNG.random((3, n)), mrp_arr, DISCOUNTS)
+    minutes = RNG.integers(OPERATING_HOURS[0] * 60, OPERATING_HOURS[1] * 60, size=n)
     
-    return pd.DataFrame(transactions)
+    transactions = pd.DataFrame({
+        'S.No': np.arange(1, n + 1),
+        'date': date_str[day_index],
+        'time': pd.to_timedelta(minutes, 'm').astype(str).str[-8:-3],
+        'product_name': name_arr[pos],
+        'quantity': qty,
+        'unit_price': unit_price,
+        'total_amount': total,
+        'payment_mode': pd.Categorical.from_codes(
+            RNG.integers(0, len(PAYMENT_MODES), size=n, dtype=np.int8),
+            categories=PAYMENT_MODES
+        ),
+        'transaction_type': pd.Categorical.from_codes(
+            RNG.choice(len(TRANSACTION_TYPES), size=n, p=TRANSACTION_TYPE_WEIGHTS).astype(np.int8),
+            categories=TRANSACTION_TYPES
+        )
+    }, copy=False)
+    
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(f"Generated {n} transactions across {len(date_str)} days "
+                     f"(avg {per_day_counts.mean():.0f}/day)")
+    return transactions
 
-def generate_expenses(start_date, end_date):
+def generate_expenses(date_str, weekdays, days):
     """Generate business expenses according to their frequency"""
-    expenses = []
-    sno = 1
-    
     # Define expense categories with their frequencies and amount ranges
     expense_categories = {
         'Rent': {'frequency': 'monthly', 'amount': (15000, 20000)},
@@ -115,33 +161,51 @@ def generate_expenses(start_date, end_date):
         'Miscellaneous': {'frequency': 'daily', 'amount': (100, 300)}
     }
     
-    for date in generate_dates(start_date, end_date):
-        day_of_month = date.day
-        day_of_week = date.weekday()
-        
-        for category, details in expense_categories.items():
-            # Check if expense should be recorded based on frequency
-            should_record = (
-                details['frequency'] == 'daily' or
-                (details['frequency'] == 'weekly' and day_of_week == 0) or
-                (details['frequency'] == 'monthly' and day_of_month == 1)
-            )
-            
-            if should_record:
-                min_amount, max_amount = details['amount']
-                amount = round(random.uniform(min_amount, max_amount), 2)
-                
-                expenses.append({
-                    'S.No': sno,
-                    'date': date.strftime('%d-%m-%Y'),
-                    'category': category,
-                    'amount': amount,
-                    'frequency': details['frequency'],
-                    'notes': f"Regular {details['frequency']} {category.lower()} expense"
-                })
-                sno += 1
+    # Days on which each frequency of expense is recorded
+    frequency_masks = {
+        'daily': np.ones(len(date_str), dtype=bool),
+        'weekly': weekdays == 0,
+        'monthly': days == 1,
+    }
+    
+    day_positions = [np.flatnonzero(frequency_masks[details['frequency']])
+                     for details in expense_categories.values()]
+    counts = [len(positions) for positions in day_positions]
+    categories = list(expense_categories)
+    frequencies = [details['frequency'] for details in expense_categories.values()]
+    min_amounts, max_amounts = zip(*(details['amount'] for details in expense_categories.values()))
+    notes = [f"Regular {frequency} {category.lower()} expense"
+             for frequency, category in zip(frequencies, categories)]
+    
+    # Draw every amount at once, then order rows by date keeping category order within a day
+    amounts = RNG.uniform(np.repeat(min_amounts, counts), np.repeat(max_amounts, counts)).round(2)
+    day_rows = np.concatenate(day_positions)
+    order = np.argsort(day_rows, kind='stable')
     
-    return pd.DataFrame(expenses)
+    return pd.DataFrame({
+        'S.No': np.arange(1, len(order) + 1),
+        'date': date_str[day_rows[order]],
+        'category': pd.Categorical(np.repeat(categories, counts)[order], categories=categories),
+        'amount': amounts[order],
+        'frequency': pd.Categorical(np.repeat(frequencies, counts)[order],
+                                    categories=list(frequency_masks)),
+        'notes': np.repeat(notes, counts)[order]
+    }, copy=False)
+
+def generate_txns_and_expenses(bdays, products):
+    """Generate transactions and expenses from per-day arrays computed once and shared"""
+    date_str = np.asarray(bdays.strftime('%d-%m-%Y'))
+    weekdays = bdays.weekday.to_numpy()
+    days = bdays.day.to_numpy()
+    return (generate_transactions(date_str, weekdays, products),
+            generate_expenses(date_str, weekdays, days))
+
+def write_table(df, output_dir, name):
+    """Write a DataFrame as CSV and as zstd-compressed Parquet"""
+    df = df.astype({col: dtype for col, dtype in OUTPUT_DTYPES.items() if col in df})
+    df.to_csv(f"{output_dir}/{name}.csv", index=False)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, f"{output_dir}/{name}.parquet", compression='zstd')
 
 def main():
     """Generate and save kirana store business data"""
@@ -153,17 +217,21 @@ def main():
     output_dir = 'kirana_data'
     os.makedirs(output_dir, exist_ok=True)
     
-    logging.info("Generating product catalog...")
-    products = generate_products(NUM_PRODUCTS)
-    products.to_csv(f"{output_dir}/products.csv", index=False)
-    
-    logging.info("Generating sales transactions...")
-    transactions = generate_transactions(start_date, end_date, products)
-    transactions.to_csv(f"{output_dir}/transactions.csv", index=False)
+    bdays = generate_dates(start_date, end_date)
     
-    logging.info("Generating expense records...")
-    expenses = generate_expenses(start_date, end_date)
-    expenses.to_csv(f"{output_dir}/expenses.csv", index=False)
+    # Outputs are independent, so write them concurrently as they become ready
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        logging.info("Generating product catalog...")
+        products = generate_products(NUM_PRODUCTS)
+        futures = [executor.submit(write_table, products, output_dir, 'products')]
+        
+        logging.info("Generating sales transactions and expense records...")
+        transactions, expenses = generate_txns_and_expenses(bdays, products)
+        futures += [executor.submit(write_table, transactions, output_dir, 'transactions'),
+                    executor.submit(write_table, expenses, output_dir, 'expenses')]
+        
+        for future in futures:
+            future.result()
     
     logging.info("Data generation completed successfully!")
 